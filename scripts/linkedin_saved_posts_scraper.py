@@ -14,11 +14,14 @@ Usage:
 - Run the script
 """
 
+import asyncio
 import os
 import re
-import time
+import sys
 import webbrowser  # Added for opening HTML page
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -29,14 +32,262 @@ except ImportError:
     exit(1)
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 except ImportError:
     print("Please install playwright: pip install playwright")
     print("Then run: playwright install chromium")
     exit(1)
 
 
-def login_to_linkedin(page) -> bool:
+_RE_SAFE = re.compile(r'[^\w\s-]')
+_RE_DASH = re.compile(r'[-\s]+')
+_RE_BULLET_TAIL = re.compile(r'[•·].*$')
+_NL_TABLE = str.maketrans('\n', ' ')
+
+# The saved posts page uses a different structure than the feed
+POST_SELECTORS = [
+    "div[data-chameleon-result-urn]",
+    "div[data-view-name='search-entity-result-content-a-template']",
+    "li.reusable-search__result-container",
+    ".entity-result",
+]
+# Any of the layouts above, for waiting on the list in a single call
+POST_CONTAINER_SEL = ", ".join(POST_SELECTORS)
+
+# Fallback chains, highest priority first. The page walker queries each chain
+# as one CSS union and ranks the matches by the first selector they satisfy.
+AUTHOR_SELECTORS = [
+    "span[dir='ltr'] span[aria-hidden='true']",
+    ".entity-result__title-text a span[aria-hidden='true']",
+    "a[href*='/in/'] span[aria-hidden='true']",
+]
+IMG_SELECTORS = [
+    "img.presence-entity__image",
+    "img.EntityPhoto-circle-4",
+    ".entity-result__universal-image img",
+    "img[class*='presence']",
+    ".presence-entity img",
+]
+CONTENT_SELECTORS = [
+    "p.entity-result__content-summary",
+    ".entity-result__content-summary",
+    ".entity-result__summary",
+]
+
+# Order of the positional rows returned by the post walker. The first field is
+# the walker's merge key (the post URN, else its URL, else author and body) and
+# is dropped when rows become post dicts, matching the API path's shape.
+POST_FIELDS = ("key", "author", "author_url", "author_image", "body", "url", "timestamp")
+
+# Post walker, registered once per document with add_init_script so the scroll
+# loop can call it by name. Containers whose URN is in `seen` (posts whose
+# text has already been read) are skipped.
+COLLECT_POSTS_INIT_JS = """
+window.__collectPosts = ({postSelectors, authorSelectors, imgSelectors, contentSelectors, seen}) => {
+    const seeMoreSuffixes = ["…see more", "...see more"];
+    const bulletTailRe = /[•·].*$/;
+    // One selector-engine walk per chain; matches are ordered by chain
+    // priority first and document order second (sort is stable).
+    const byPriority = (el, selectors) => {
+        const ranked = [];
+        for (const node of el.querySelectorAll(selectors.join(", "))) {
+            ranked.push([selectors.findIndex((sel) => node.matches(sel)), node]);
+        }
+        return ranked.sort((a, b) => a[0] - b[0]).map(([, node]) => node);
+    };
+    const absolute = (href) => href.startsWith("http") ? href : `https://www.linkedin.com${href}`;
+    const urnAttr = "data-chameleon-result-urn";
+    const urnOf = (el) => el.getAttribute(urnAttr)
+        || el.closest(`[${urnAttr}]`)?.getAttribute(urnAttr)
+        || el.querySelector(`[${urnAttr}]`)?.getAttribute(urnAttr)
+        || "";
+
+    let selector = null;
+    let elements = [];
+    for (const sel of postSelectors) {
+        const found = document.querySelectorAll(sel);
+        if (found.length) {
+            selector = sel;
+            elements = Array.from(found);
+            break;
+        }
+    }
+
+    const posts = [];
+    const errors = [];
+    for (const el of elements) {
+        // One malformed container must not abort the walk over the others
+        try {
+            // Posts collected on an earlier scroll are skipped before any selector work
+            const urn = urnOf(el);
+            if (urn && seen && seen.has(urn)) continue;
+
+            let author = "Unknown Author";
+            for (const authorEl of byPriority(el, authorSelectors)) {
+                const text = authorEl.innerText.trim();
+                if (text) {
+                    author = text;
+                    break;
+                }
+            }
+
+            let authorUrl = "";
+            const authorLinkEl = el.querySelector("a[href*='/in/']");
+            const authorHref = authorLinkEl && authorLinkEl.getAttribute("href");
+            if (authorHref) authorUrl = absolute(authorHref);
+
+            let authorImage = "";
+            for (const imgEl of byPriority(el, imgSelectors)) {
+                const src = imgEl.getAttribute("src");
+                if (src && !src.includes("data:")) {
+                    authorImage = src;
+                    break;
+                }
+            }
+
+            let body = "";
+            for (const contentEl of byPriority(el, contentSelectors)) {
+                body = contentEl.innerText.trim();
+                // Text is already trimmed, so a plain suffix check replaces the regex
+                for (const suffix of seeMoreSuffixes) {
+                    if (body.endsWith(suffix)) {
+                        body = body.slice(0, -suffix.length).trim();
+                        break;
+                    }
+                }
+                if (body.length > 10) break;
+            }
+
+            let postUrl = "";
+            const linkEl = el.querySelector("a[href*='/feed/update/']");
+            const postHref = linkEl && linkEl.getAttribute("href");
+            if (postHref) postUrl = absolute(postHref);
+
+            let timestamp = "";
+            const timeEl = el.querySelector("p.t-black--light.t-12, .t-12.t-black--light");
+            if (timeEl) {
+                timestamp = timeEl.innerText.trim();
+                timestamp = timestamp.replace(bulletTailRe, "").trim();
+                timestamp = timestamp.split("\\n")[0].trim();
+            }
+
+            // Positional row (see POST_FIELDS) so field names aren't repeated per post
+            posts.push([
+                urn || postUrl || `${author}\n${body}`,
+                author,
+                authorUrl,
+                authorImage,
+                body,
+                postUrl,
+                timestamp,
+            ]);
+        } catch (e) {
+            errors.push(String((e && e.message) || e));
+        }
+    }
+
+    return {selector, posts, errors};
+};
+"""
+
+# Scroll loop run inside the page in a single evaluate, so scrolling costs no CDP
+# round-trips; progress is pushed back without awaiting it. Posts are collected
+# after every scroll and merged by URN, so posts LinkedIn unmounts while
+# scrolling are kept and each post is walked until its text has rendered.
+SCROLL_AND_COLLECT_JS = """
+async ({maxScrolls, maxNoNewPosts, waitTimeout, selectors}) => {
+    const countPosts = () => document.querySelectorAll('div[data-chameleon-result-urn]').length;
+    // Resolve as soon as more posts are appended, or give up after waitTimeout
+    const waitForGrowth = (prev) => new Promise((resolve) => {
+        const initial = countPosts();
+        if (initial > prev) return resolve(initial);
+        const finish = (count) => {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(count);
+        };
+        const observer = new MutationObserver(() => {
+            const count = countPosts();
+            if (count > prev) finish(count);
+        });
+        const timer = setTimeout(() => finish(countPosts()), waitTimeout);
+        observer.observe(document.body, {childList: true, subtree: true});
+    });
+
+    // A container can be counted before its text has rendered, so rows are
+    // only kept once they have a body or an author and later walks fill in
+    // fields that were still empty. Rows are skipped by the walker once key,
+    // author, body and url are set; avatar and timestamp are optional, so
+    // posts without them aren't walked again on every scroll.
+    const unknownAuthor = "Unknown Author";
+    const requiredFields = [0, 1, 4, 5];
+    const hasValue = (row, i) => Boolean(row[i]) && !(i === 1 && row[i] === unknownAuthor);
+    const collected = new Map();
+    const complete = new Set();
+    const errors = new Set();
+    let selector = null;
+    const collect = () => {
+        const batch = window.__collectPosts({...selectors, seen: complete});
+        selector = batch.selector || selector;
+        for (const error of batch.errors) errors.add(error);
+        let added = 0;
+        for (const post of batch.posts) {
+            const key = post[0];
+            let row = collected.get(key);
+            if (row) {
+                for (let i = 1; i < post.length; i++) {
+                    if (!hasValue(row, i) && hasValue(post, i)) row[i] = post[i];
+                }
+            } else if (hasValue(post, 1) || hasValue(post, 4)) {
+                row = post;
+                collected.set(key, row);
+                added++;
+            } else {
+                continue;
+            }
+            if (requiredFields.every((i) => hasValue(row, i))) complete.add(key);
+        }
+        return added;
+    };
+
+    collect();
+    let lastCount = countPosts();
+    let noNewPosts = 0;
+    let scrolls = 0;
+    while (scrolls < maxScrolls && noNewPosts < maxNoNewPosts) {
+        window.scrollTo(0, document.body.scrollHeight);
+        scrolls++;
+        lastCount = await waitForGrowth(lastCount);
+        noNewPosts = collect() ? 0 : noNewPosts + 1;
+        window.__reportScrollProgress(scrolls, collected.size, noNewPosts);
+    }
+    return {scrolls, selector, posts: Array.from(collected.values()), errors: Array.from(errors)};
+}
+"""
+
+# Voyager feed endpoint tried for saved posts. It has not been confirmed to return
+# only saved items (the page itself is a search-results listing), so the API
+# path is opt-in via LINKEDIN_USE_API and page scraping stays the default.
+VOYAGER_SAVED_POSTS_URL = (
+    "https://www.linkedin.com/voyager/api/feed/updatesV2"
+    "?q=chronFeed&moduleKey=saved-items"
+)
+USE_VOYAGER_API = os.getenv("LINKEDIN_USE_API", "").lower() in ("1", "true", "yes")
+
+# Only the img src attribute is read, so the decoded resources are never needed
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font", "stylesheet")
+# Hosts serving those resources; only their requests are routed, so the feed's
+# XHR/fetch calls are never held up by a Python round-trip
+BLOCKED_RESOURCE_HOSTS = re.compile(r"^https://(media|static)\.licdn\.com/")
+
+# Browser profile reused across runs so the LinkedIn session survives
+PROFILE_DIR = Path.home() / ".li2notion_profile"
+
+# Large write buffer for the README index, which is streamed line by line
+_INDEX_BUFFER_SIZE = 1 << 20
+
+
+async def login_to_linkedin(page) -> bool:
     """Attempt to log in using credentials from .env file."""
     email = os.getenv("LINKEDIN_EMAIL")
     password = os.getenv("LINKEDIN_PASSWORD")
@@ -50,22 +301,22 @@ def login_to_linkedin(page) -> bool:
     
     try:
         # Fill in email
-        email_input = page.wait_for_selector('input[name="session_key"], input#username', timeout=10000)
+        email_input = await page.wait_for_selector('input[name="session_key"], input#username', timeout=10000)
         if email_input:
-            email_input.fill(email)
+            await email_input.fill(email)
         
         # Fill in password
-        password_input = page.wait_for_selector('input[name="session_password"], input#password', timeout=5000)
+        password_input = await page.wait_for_selector('input[name="session_password"], input#password', timeout=5000)
         if password_input:
-            password_input.fill(password)
+            await password_input.fill(password)
         
         # Click sign in button
-        sign_in_button = page.query_selector('button[type="submit"], button[data-litms-control-urn="login-submit"]')
+        sign_in_button = await page.query_selector('button[type="submit"], button[data-litms-control-urn="login-submit"]')
         if sign_in_button:
-            sign_in_button.click()
+            await sign_in_button.click()
         
         # Wait for navigation
-        time.sleep(5)
+        await asyncio.sleep(5)
         
         # Check if login was successful (no longer on login page)
         if "login" not in page.url and "signin" not in page.url and "checkpoint" not in page.url:
@@ -80,156 +331,192 @@ def login_to_linkedin(page) -> bool:
         return False
 
 
+async def _block_heavy_resources(route):
+    """Abort requests the scraper never needs to render (images, media, fonts, CSS)."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(text: str, max_length: int = 80) -> str:
     """Create a safe filename from text."""
-    safe = re.sub(r'[^\w\s-]', '', text)
-    safe = re.sub(r'[-\s]+', '-', safe).strip('-')
+    safe = _RE_DASH.sub('-', _RE_SAFE.sub('', text)).strip('-')
     return safe[:max_length] if safe else 'untitled'
 
 
-def extract_posts(page) -> list[dict]:
+async def extract_posts(page) -> list[dict]:
     """Extract saved posts from the LinkedIn page."""
     posts = []
     
     # Wait for posts to load
     print("Waiting for posts to load...")
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     print("Scrolling to load all posts...")
-    last_post_count = 0
-    no_new_posts_count = 0
-    scroll_count = 0
     max_scrolls = 200  # Increased from 100 to 200
     max_no_new_posts = 3  # Increased from 5 to 10 to handle slow loading
     
-    while scroll_count < max_scrolls and no_new_posts_count < max_no_new_posts:
-        # Scroll down
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(2.5)  # Increased wait time from 2 to 2.5 seconds
+    def report_progress(scroll_count: int, count: int, no_new_posts_count: int):
+        if no_new_posts_count:
+            print(f"  Scrolled {scroll_count} times... No new posts (attempt {no_new_posts_count}/{max_no_new_posts})")
+        else:
+            print(f"  Scrolled {scroll_count} times... Found {count} posts")
+    
+    await page.expose_function("__reportScrollProgress", report_progress)
+    
+    try:
+        result = await page.evaluate(SCROLL_AND_COLLECT_JS, {
+            "maxScrolls": max_scrolls,
+            "maxNoNewPosts": max_no_new_posts,
+            "waitTimeout": 8000,
+            "selectors": {
+                "postSelectors": POST_SELECTORS,
+                "authorSelectors": AUTHOR_SELECTORS,
+                "imgSelectors": IMG_SELECTORS,
+                "contentSelectors": CONTENT_SELECTORS,
+            },
+        })
+    except Exception as e:
+        print(f"Error while scrolling and extracting posts: {e}")
+        return posts
+    
+    print(f"Finished scrolling. Total scrolls: {result['scrolls']}")
+    
+    for error in result["errors"]:
+        print(f"  Error extracting post: {error}")
+    
+    if result["selector"]:
+        print(f"Found {len(result['posts'])} posts using selector: {result['selector']}")
+    
+    lines = []
+    for i, row in enumerate(result["posts"]):
+        post = dict(zip(POST_FIELDS[1:], row[1:]))
+        if post["body"] or post["author"] != "Unknown Author":
+            post["index"] = i + 1
+            posts.append(post)
+            lines.append(f"  Extracted post {i + 1}: {post['author'][:30]}...\n")
+    sys.stdout.write("".join(lines))
+    
+    return posts
+
+
+def _dig(obj, *keys):
+    """Walk nested dicts/lists, returning None as soon as a key is missing."""
+    for key in keys:
+        try:
+            obj = obj[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return obj
+
+
+def _api_post_to_dict(update: dict) -> dict:
+    """Convert a Voyager UpdateV2 element into the scraper's post dict."""
+    actor = update.get("actor") or {}
+    
+    author = (_dig(actor, "name", "text") or "").strip() or "Unknown Author"
+    author_url = (_dig(actor, "navigationContext", "actionTarget") or "").split("?")[0]
+    
+    author_image = ""
+    vector = _dig(actor, "image", "attributes", 0, "miniProfile", "picture", "com.linkedin.common.VectorImage")
+    if vector and vector.get("artifacts"):
+        author_image = vector.get("rootUrl", "") + vector["artifacts"][0].get("fileIdentifyingUrlPathSegment", "")
+    
+    body = (_dig(update, "commentary", "text", "text") or "").strip()
+    
+    urn = _dig(update, "updateMetadata", "urn") or ""
+    post_url = f"https://www.linkedin.com/feed/update/{urn}/" if urn else ""
+    
+    timestamp = _dig(actor, "subDescription", "text") or ""
+    timestamp = _RE_BULLET_TAIL.sub('', timestamp).strip()
+    
+    return {
+        "author": author,
+        "author_url": author_url,
+        "author_image": author_image,
+        "body": body,
+        "url": post_url,
+        "timestamp": timestamp,
+    }
+
+
+async def fetch_posts_via_api(context) -> list[dict] | None:
+    """Fetch saved posts straight from LinkedIn's Voyager JSON API.
+    
+    Uses the browser context's cookies, so it only works after login.
+    Returns None when the API is unavailable so the caller can fall back
+    to scraping the page.
+    """
+    cookies = await context.cookies("https://www.linkedin.com")
+    jsession = next((c["value"] for c in cookies if c["name"] == "JSESSIONID"), None)
+    if not jsession:
+        print("No LinkedIn session cookie found, skipping API fetch.")
+        return None
+    
+    headers = {
+        "csrf-token": jsession.strip('"'),
+        "x-restli-protocol-version": "2.0.0",
+        "accept": "application/json",
+    }
+    
+    # Keyed like the page collector so overlapping pages can't duplicate a post
+    posts_by_key: dict[str, dict] = {}
+    start = 0
+    page_size = 20
+    max_pages = 200
+    
+    for _ in range(max_pages):
+        url = f"{VOYAGER_SAVED_POSTS_URL}&start={start}&count={page_size}"
+        try:
+            response = await context.request.get(url, headers=headers, timeout=30000)
+        except Exception as e:
+            print(f"API request failed: {e}")
+            return None
         
-        # Check current post count
-        current_count = page.evaluate("""
-            () => document.querySelectorAll('div[data-chameleon-result-urn]').length
-        """)
+        if response.status in (401, 403, 429):
+            print(f"API returned {response.status}, falling back to page scraping.")
+            return None
+        if not response.ok:
+            print(f"API returned unexpected status {response.status}.")
+            return None
         
-        scroll_count += 1
+        try:
+            data = await response.json()
+        except Exception as e:
+            print(f"Could not parse API response: {e}")
+            return None
         
-        if current_count > last_post_count:
-            print(f"  Scrolled {scroll_count} times... Found {current_count} posts")
-            last_post_count = current_count
-            no_new_posts_count = 0  # Reset counter when new posts found
-        else:
-            no_new_posts_count += 1
-            print(f"  Scrolled {scroll_count} times... No new posts (attempt {no_new_posts_count}/{max_no_new_posts})")
+        elements = data.get("elements") or []
+        if not elements:
+            break
+        
+        for update in elements:
+            post = _api_post_to_dict(update)
+            if post["body"] or post["author"] != "Unknown Author":
+                posts_by_key.setdefault(post["url"] or f"{post['author']}\n{post['body']}", post)
         
-        if scroll_count % 5 == 0:
-            print("  Pausing for content to load...")
-            time.sleep(4)  # Increased pause time to 4 seconds
-    
-    print(f"Finished scrolling. Total scrolls: {scroll_count}")
-    
-    # The saved posts page uses a different structure than the feed
-    post_selectors = [
-        "div[data-chameleon-result-urn]",
-        "div[data-view-name='search-entity-result-content-a-template']",
-        "li.reusable-search__result-container",
-        ".entity-result",
-    ]
-    
-    post_elements = []
-    for selector in post_selectors:
-        elements = page.query_selector_all(selector)
-        if elements:
-            post_elements = elements
-            print(f"Found {len(elements)} posts using selector: {selector}")
+        print(f"  Fetched {len(posts_by_key)} posts from the API...")
+        
+        start += len(elements)
+        total = _dig(data, "paging", "total")
+        if total is not None and start >= total:
             break
     
-    for i, post_el in enumerate(post_elements):
-        try:
-            author = "Unknown Author"
-            author_selectors = [
-                "span[dir='ltr'] span[aria-hidden='true']",
-                ".entity-result__title-text a span[aria-hidden='true']",
-                "a[href*='/in/'] span[aria-hidden='true']",
-            ]
-            
-            for sel in author_selectors:
-                author_el = post_el.query_selector(sel)
-                if author_el:
-                    author = author_el.inner_text().strip()
-                    if author:
-                        break
-            
-            author_url = ""
-            author_link_el = post_el.query_selector("a[href*='/in/']")
-            if author_link_el:
-                href = author_link_el.get_attribute("href")
-                if href:
-                    author_url = href if href.startswith("http") else f"https://www.linkedin.com{href}"
-            
-            author_image = ""
-            img_selectors = [
-                "img.presence-entity__image",
-                "img.EntityPhoto-circle-4",
-                ".entity-result__universal-image img",
-                "img[class*='presence']",
-                ".presence-entity img",
-            ]
-            for sel in img_selectors:
-                img_el = post_el.query_selector(sel)
-                if img_el:
-                    src = img_el.get_attribute("src")
-                    if src and "data:" not in src:
-                        author_image = src
-                        break
-            
-            body = ""
-            content_selectors = [
-                "p.entity-result__content-summary",
-                ".entity-result__content-summary",
-                ".entity-result__summary",
-            ]
-            
-            for sel in content_selectors:
-                content_el = post_el.query_selector(sel)
-                if content_el:
-                    body = content_el.inner_text().strip()
-                    body = re.sub(r'…see more\s*$', '', body).strip()
-                    body = re.sub(r'\.\.\.see more\s*$', '', body).strip()
-                    if len(body) > 10:
-                        break
-            
-            post_url = ""
-            link_el = post_el.query_selector("a[href*='/feed/update/']")
-            if link_el:
-                href = link_el.get_attribute("href")
-                if href:
-                    post_url = href if href.startswith("http") else f"https://www.linkedin.com{href}"
-            
-            timestamp = ""
-            time_el = post_el.query_selector("p.t-black--light.t-12, .t-12.t-black--light")
-            if time_el:
-                timestamp = time_el.inner_text().strip()
-                timestamp = re.sub(r'[•·].*$', '', timestamp).strip()
-                timestamp = timestamp.split('\n')[0].strip()
-            
-            if body or author != "Unknown Author":
-                posts.append({
-                    "author": author,
-                    "author_url": author_url,
-                    "author_image": author_image,
-                    "body": body,
-                    "url": post_url,
-                    "timestamp": timestamp,
-                    "index": i + 1
-                })
-                print(f"  Extracted post {i + 1}: {author[:30]}...")
-                
-        except Exception as e:
-            print(f"  Error extracting post {i + 1}: {e}")
-            continue
+    posts = list(posts_by_key.values())
+    for i, post in enumerate(posts):
+        post["index"] = i + 1
     
-    return posts
+    # An empty result is more likely a changed API shape than an empty list,
+    # so let the page scraper have a go.
+    return posts or None
+
+
+def _write_file(task: tuple[Path, bytes]) -> None:
+    """Write pre-encoded content to a file (runs in a worker thread)."""
+    filepath, data = task
+    filepath.write_bytes(data)
 
 
 def create_markdown_files(posts: list[dict], output_dir: str = "saved_posts"):
@@ -240,20 +527,19 @@ def create_markdown_files(posts: list[dict], output_dir: str = "saved_posts"):
     now = datetime.now()
     import_time = now.strftime("%B %d, %Y %I:%M %p (GMT+5:30)")
     
+    # The import-time line is identical for every post, so encode it once
+    import_time_line = f"App Imported Time: {import_time}\n".encode('utf-8')
+    
+    tasks = []
     for post in posts:
-        first_line = post['body'].split('\n')[0] if post['body'] else "LinkedIn Post"
-        
-        title_slug = sanitize_filename(first_line)
-        filename = f"{post['index']:03d}-{title_slug}.md"
+        first_line = (post['body'] or "LinkedIn Post").split('\n', 1)[0]
+        filename = f"{post['index']:03d}-{sanitize_filename(first_line)}.md"
         filepath = output_path / filename
         
         # Format timestamp for Post Created At
         post_created = post['timestamp'] if post['timestamp'] else "Unknown"
         
-        md_content = f"""# {first_line}
-
-App Imported Time: {import_time}
-Author URL: {post['author_url']}
+        post_content = f"""Author URL: {post['author_url']}
 Post Created At: {post_created}
 Post Link: {post['url']}
 
@@ -265,11 +551,22 @@ Post Link: {post['url']}
 </aside>
 """
         
-        filepath.write_text(md_content, encoding='utf-8')
-        print(f"Created: {filepath}")
+        tasks.append((filepath, b"".join([
+            f"# {first_line}\n\n".encode('utf-8'),
+            import_time_line,
+            post_content.encode('utf-8'),
+        ])))
+    
+    # Writes are pure I/O, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(_write_file, tasks))
+    # One write for the whole listing instead of a print() per file
+    sys.stdout.write("".join(f"Created: {filepath}\n" for filepath, _ in tasks))
     
-    # Create index file
-    index_content = f"""# LinkedIn Saved Posts
+    # Create index file, streamed line by line rather than built up in memory
+    index_path = output_path / "README.md"
+    with open(index_path, 'wb', buffering=_INDEX_BUFFER_SIZE) as f:
+        f.write(f"""# LinkedIn Saved Posts
 
 Exported on: {now.strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -277,15 +574,13 @@ Total posts: {len(posts)}
 
 ## Posts
 
-"""
-    for post in posts:
-        title_slug = sanitize_filename(post['body'].split('\n')[0] if post['body'] else "LinkedIn Post")
-        filename = f"{post['index']:03d}-{title_slug}.md"
-        preview = post['body'][:80].replace('\n', ' ') + "..." if len(post['body']) > 80 else post['body'].replace('\n', ' ')
-        index_content += f"- [{post['author']}]({filename}): {preview}\n"
+""".encode('utf-8'))
+        # Filenames were built once in the loop above; reuse them from the tasks
+        for post, (filepath, _) in zip(posts, tasks):
+            body = post['body']
+            preview = body[:80].translate(_NL_TABLE) + ("..." if len(body) > 80 else "")
+            f.write(f"- [{post['author']}]({filepath.name}): {preview}\n".encode('utf-8'))
     
-    index_path = output_path / "README.md"
-    index_path.write_text(index_content, encoding='utf-8')
     print(f"\nCreated index: {index_path}")
     
     return output_path
@@ -305,7 +600,7 @@ def open_html_viewer(output_dir: str):
         print("Copy index.html to your saved_posts folder to view posts as a blog.")
 
 
-def main():
+async def main():
     print("=" * 60)
     print("LinkedIn Saved Posts Scraper")
     print("=" * 60)
@@ -320,19 +615,23 @@ def main():
     print("Starting browser...")
     print()
     
-    with sync_playwright() as p:
-        # Launch browser in non-headless mode so user can log in
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
+    async with async_playwright() as p:
+        # Launch browser in non-headless mode so user can log in. The persistent
+        # profile keeps the session cookies, so later runs skip the login step.
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=str(PROFILE_DIR),
+            headless=False,
             viewport={"width": 1280, "height": 800},
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         )
-        page = context.new_page()
+        # Must be registered before navigating so the walker exists on the saved posts page
+        await context.add_init_script(COLLECT_POSTS_INIT_JS)
+        page = context.pages[0] if context.pages else await context.new_page()
         
         saved_posts_url = "https://www.linkedin.com/my-items/saved-posts/"
         print(f"Navigating to: {saved_posts_url}")
-        page.goto(saved_posts_url, wait_until="domcontentloaded", timeout=60000)
-        time.sleep(3)
+        await page.goto(saved_posts_url, wait_until="domcontentloaded", timeout=60000)
+        await asyncio.sleep(3)
         
         if "login" in page.url or "signin" in page.url:
             print()
@@ -340,7 +639,7 @@ def main():
             print("LOGIN REQUIRED")
             print("=" * 60)
             
-            login_success = login_to_linkedin(page)
+            login_success = await login_to_linkedin(page)
             
             if not login_success:
                 print()
@@ -350,29 +649,39 @@ def main():
                 print()
                 
                 try:
-                    page.wait_for_url("**/my-items/saved-posts/**", timeout=300000)
+                    await page.wait_for_url("**/my-items/saved-posts/**", timeout=300000)
                     print("Login successful! Continuing...")
                 except PlaywrightTimeout:
                     print("Login timeout. Please run the script again.")
-                    browser.close()
+                    await context.close()
                     return
             else:
                 print("Navigating to saved posts...")
-                page.goto(saved_posts_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)
+                await page.goto(saved_posts_url, wait_until="domcontentloaded", timeout=60000)
+                await asyncio.sleep(5)
         
-        print("Waiting for saved posts page to load...")
-        try:
-            page.wait_for_selector("div[data-chameleon-result-urn], .entity-result, .reusable-search__result-container", timeout=30000)
-            print("Posts container found!")
-        except PlaywrightTimeout:
-            print("Could not find posts container, will try to extract anyway...")
-        
-        time.sleep(3)
+        posts = None
+        if USE_VOYAGER_API:
+            # Experimental: fetching the JSON directly skips scrolling, with the page as fallback
+            print("\nFetching saved posts from the API (LINKEDIN_USE_API is set)...")
+            posts = await fetch_posts_via_api(context)
         
-        # Extract posts
-        print("\nExtracting saved posts...")
-        posts = extract_posts(page)
+        if posts is None:
+            # Registered only for scraping, after login so that page still renders normally
+            await context.route(BLOCKED_RESOURCE_HOSTS, _block_heavy_resources)
+            
+            print("Waiting for saved posts page to load...")
+            try:
+                await page.wait_for_selector(POST_CONTAINER_SEL, timeout=30000)
+                print("Posts container found!")
+            except PlaywrightTimeout:
+                print("Could not find posts container, will try to extract anyway...")
+            
+            await asyncio.sleep(3)
+            
+            # Extract posts
+            print("\nExtracting saved posts...")
+            posts = await extract_posts(page)
         
         if not posts:
             print("\nNo posts found. This could be because:")
@@ -392,9 +701,9 @@ def main():
             open_html_viewer(str(output_dir))
         
         print("\nClosing browser in 5 seconds...")
-        time.sleep(5)
-        browser.close()
+        await asyncio.sleep(5)
+        await context.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())